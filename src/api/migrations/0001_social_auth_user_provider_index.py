@@ -0,0 +1,27 @@
+"""
+Composite index for the hot UserSocialAuth lookup.
+
+social_django's default schema only has a unique (provider, uid) index,
+so the per-request get(user=..., provider='mediawiki') in the profile
+endpoints can't use a covering index. Add (user_id, provider) so the
+lookup is a sub-millisecond index seek.
+"""
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_django', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX idx_social_user_provider "
+                "ON social_auth_usersocialauth (user_id, provider)"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
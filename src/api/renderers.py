@@ -0,0 +1,27 @@
+"""
+Custom REST framework renderers.
+
+ORJSONRenderer replaces DRF's stdlib-json renderer with orjson, which
+serializes straight to bytes and is significantly faster for the list
+payloads returned by the contributions and search endpoints.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render responses to JSON using orjson.
+
+    orjson outputs bytes natively, so charset is None to prevent DRF
+    from re-encoding the payload.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC)
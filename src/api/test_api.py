@@ -70,6 +70,31 @@ class TestUserContributionsAPI:
         response = oauth_authenticated_client.get('/api/user/contributions/?limit=100')
         assert response.status_code in [200, 500]
 
+    @patch('api.views.get_user_contributions')
+    def test_contributions_high_limit(self, mock_get_contributions,
+                                      oauth_authenticated_client):
+        """Test that maximum-limit requests come back as valid JSON."""
+        mock_get_contributions.return_value = [
+            {
+                'title': f'Page {i}',
+                'timestamp': '2025-01-15T12:00:00Z',
+                'comment': '',
+                'size': i
+            }
+            for i in range(50)
+        ]
+
+        response = oauth_authenticated_client.get('/api/user/contributions/?limit=50')
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 50
+        assert data[0]['title'] == 'Page 0'
+
+    def test_contributions_invalid_limit(self, oauth_authenticated_client):
+        """Test that a malformed limit returns 400 rather than 500."""
+        response = oauth_authenticated_client.get('/api/user/contributions/?limit=abc')
+        assert response.status_code == 400
+
 
 @pytest.mark.django_db
 @pytest.mark.api
@@ -93,6 +118,11 @@ class TestWikiSearchAPI:
         response = client.get('/api/wiki/search/?q=test&namespace=4')
         assert response.status_code in [200, 500]
 
+    def test_search_invalid_namespace(self, client):
+        """Test that a malformed namespace returns 400 rather than 500."""
+        response = client.get('/api/wiki/search/?q=test&namespace=foo')
+        assert response.status_code == 400
+
 
 @pytest.mark.django_db
 @pytest.mark.api
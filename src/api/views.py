@@ -1,16 +1,32 @@
+import hashlib
+
+import orjson
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import quote_etag
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ParseError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from social_django.models import UserSocialAuth
 from user_profile.mwclient_utils import get_user_info, get_user_contributions
-from wiki_replica.models import Page, RecentChanges
-from .serializers import (
-    UserProfileSerializer,
-    ContributionSerializer,
-    WikiPageSerializer,
-    WikiStatisticsSerializer
-)
+from wiki_replica.models import Page, RecentChanges, SiteStats
+
+
+def _int_param(request, name, default, lo, hi):
+    """
+    Parse an integer query parameter, clamped to [lo, hi].
+
+    Raises ParseError (HTTP 400) on malformed input instead of letting
+    a ValueError bubble up as a 500.
+    """
+    try:
+        value = int(request.GET.get(name, default))
+    except ValueError:
+        raise ParseError(f'{name} must be an integer')
+    return max(lo, min(hi, value))
 
 
 @api_view(['GET'])
@@ -20,13 +36,19 @@ def user_profile(request):
     Get authenticated user's profile information including edit count and groups.
     """
     try:
-        social_auth = UserSocialAuth.objects.get(
-            user=request.user,
+        social_auth = UserSocialAuth.objects.only('extra_data').get(
+            user_id=request.user.id,
             provider='mediawiki'
         )
 
+        # The social auth row is already in hand — pass the resolved
+        # username down so the helper skips its own lookup.
+        username = social_auth.extra_data.get(
+            'username', request.user.username
+        )
+
         try:
-            user_info = get_user_info(request.user)
+            user_info = get_user_info(request.user, username=username)
             data = {
                 'username': user_info['name'],
                 'edit_count': user_info['editcount'],
@@ -41,8 +63,7 @@ def user_profile(request):
                 'has_oauth': True
             }
 
-        serializer = UserProfileSerializer(data)
-        return Response(serializer.data)
+        return Response(data)
 
     except UserSocialAuth.DoesNotExist:
         return Response(
@@ -51,6 +72,10 @@ def user_profile(request):
         )
 
 
+# How long serialized search responses stay cached.
+WIKI_SEARCH_CACHE_TTL = 300
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_contributions(request):
@@ -59,12 +84,11 @@ def user_contributions(request):
     Query parameters:
     - limit: Number of contributions to return (default: 10, max: 50)
     """
-    limit = min(int(request.GET.get('limit', 10)), 50)
+    limit = _int_param(request, 'limit', default=10, lo=1, hi=50)
 
     try:
         contributions = get_user_contributions(request.user, total=limit)
-        serializer = ContributionSerializer(contributions, many=True)
-        return Response(serializer.data)
+        return Response(contributions)
     except Exception as e:
         return Response(
             {'error': str(e)},
@@ -75,15 +99,26 @@ def user_contributions(request):
 @api_view(['GET'])
 def wiki_search(request):
     """
-    Search wiki pages by title.
+    Search wiki pages by title prefix.
+
+    Prefix matching (istartswith) is used instead of a substring match
+    because LIKE '%term%' cannot use the replica's (page_namespace,
+    page_title) index and degrades to a full table scan.
+
+    Results are cached per (namespace, limit, term) as pre-serialized
+    bytes, so repeated hot queries skip the database and serialization
+    entirely.
+
     Query parameters:
     - q: Search query
     - namespace: Namespace to search in (default: 0)
     - limit: Number of results (default: 20, max: 100)
+    - offset: Number of results to skip, for paging (default: 0)
     """
     query = request.GET.get('q', '').strip()
-    namespace = int(request.GET.get('namespace', 0))
-    limit = min(int(request.GET.get('limit', 20)), 100)
+    namespace = _int_param(request, 'namespace', default=0, lo=0, hi=5000)
+    limit = _int_param(request, 'limit', default=20, lo=1, hi=100)
+    offset = _int_param(request, 'offset', default=0, lo=0, hi=10000)
 
     if not query:
         return Response(
@@ -91,20 +126,33 @@ def wiki_search(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    search_term = query.replace(' ', '_')
+    cache_key = f'search:{namespace}:{limit}:{offset}:{search_term}'
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return HttpResponse(cached, content_type='application/json')
+
     try:
-        search_term = query.replace(' ', '_')
-        results = Page.objects.filter(
+        results = list(Page.objects.filter(
             page_namespace=namespace,
-            page_title__icontains=search_term
-        ).order_by('page_title')[:limit]
-
-        serializer = WikiPageSerializer(results, many=True)
-        return Response({
+            page_title__istartswith=search_term
+        ).order_by('page_title').values(
+            'page_id',
+            'page_title',
+            'page_namespace',
+            'page_len',
+            'page_is_redirect'
+        )[offset:offset + limit])
+
+        body = orjson.dumps({
             'query': query,
             'namespace': namespace,
-            'count': len(serializer.data),
-            'results': serializer.data
+            'offset': offset,
+            'count': len(results),
+            'results': results
         })
+        cache.set(cache_key, body, WIKI_SEARCH_CACHE_TTL)
+        return HttpResponse(body, content_type='application/json')
     except Exception as e:
         return Response(
             {'error': str(e)},
@@ -112,33 +160,83 @@ def wiki_search(request):
         )
 
 
+WIKI_STATS_CACHE_KEY = 'wiki:stats:v1'
+WIKI_STATS_TTL = 60  # seconds
+
+
+def _compute_wiki_statistics():
+    """
+    Run the statistics queries against the wiki replica.
+
+    Prefers the pre-aggregated site_stats row (an O(1) read MediaWiki
+    maintains itself) over counting the page table; the COUNT aggregate
+    remains as a fallback for databases without site_stats.
+    """
+    page_counts = None
+    try:
+        stats_row = SiteStats.objects.values(
+            'ss_total_pages', 'ss_good_articles'
+        ).first()
+        if stats_row and stats_row['ss_total_pages'] is not None:
+            page_counts = {
+                'total_pages': stats_row['ss_total_pages'],
+                'content_pages': stats_row['ss_good_articles'] or 0,
+                'redirects': Page.objects.filter(
+                    page_is_redirect=True
+                ).count(),
+            }
+    except Exception:
+        page_counts = None
+
+    if page_counts is None:
+        page_counts = Page.objects.aggregate(
+            total_pages=Count('page_id'),
+            content_pages=Count(
+                'page_id',
+                filter=Q(page_namespace=0, page_is_redirect=False)
+            ),
+            redirects=Count('page_id', filter=Q(page_is_redirect=True))
+        )
+
+    try:
+        recent_changes_count = RecentChanges.objects.count()
+    except Exception:
+        recent_changes_count = 0
+
+    return {
+        'total_pages': page_counts['total_pages'],
+        'content_pages': page_counts['content_pages'],
+        'redirects': page_counts['redirects'],
+        'recent_changes_count': recent_changes_count
+    }
+
+
 @api_view(['GET'])
 def wiki_statistics(request):
     """
     Get wiki database statistics including page counts and recent changes.
+
+    Results are cached for a short TTL and served with an ETag so
+    polling clients get 304s without touching the database.
     """
     try:
-        total_pages = Page.objects.count()
-        content_pages = Page.objects.filter(
-            page_namespace=0,
-            page_is_redirect=False
-        ).count()
-        redirects = Page.objects.filter(page_is_redirect=True).count()
+        data = cache.get_or_set(
+            WIKI_STATS_CACHE_KEY, _compute_wiki_statistics, WIKI_STATS_TTL
+        )
 
-        try:
-            recent_changes_count = RecentChanges.objects.count()
-        except Exception:
-            recent_changes_count = 0
-
-        data = {
-            'total_pages': total_pages,
-            'content_pages': content_pages,
-            'redirects': redirects,
-            'recent_changes_count': recent_changes_count
-        }
-
-        serializer = WikiStatisticsSerializer(data)
-        return Response(serializer.data)
+        etag = quote_etag(
+            hashlib.md5(orjson.dumps(data), usedforsecurity=False).hexdigest()
+        )
+        # GZipMiddleware weakens the ETag it sends (W/"..."), so clients
+        # echo the weak form back; compare weak-insensitively.
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        if if_none_match.removeprefix('W/') == etag:
+            return HttpResponseNotModified()
+
+        response = Response(data)
+        response['ETag'] = etag
+        response['Cache-Control'] = f'public, max-age={WIKI_STATS_TTL}'
+        return response
     except Exception as e:
         return Response(
             {'error': str(e)},
@@ -1,8 +1,16 @@
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from social_django.models import UserSocialAuth
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep the process-local cache from leaking state between tests."""
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(db):
     """Create a test user."""
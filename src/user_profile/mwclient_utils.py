@@ -14,20 +14,174 @@ WHY MWCLIENT INSTEAD OF PYWIKIBOT FOR WEB APPS:
 Use this module for user-authenticated API operations in Django views.
 """
 
-import mwclient
+import threading
+import time
+from functools import lru_cache
+from urllib.parse import urlparse
+
+import orjson
+import requests
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter, Retry
 from social_django.models import UserSocialAuth
 
+# How long a resolved MediaWiki username stays cached. Usernames are
+# effectively stable, so a long TTL is safe.
+USERNAME_CACHE_TTL = 3600
+
+# One connection pool for every outbound MediaWiki call. Sessions carry
+# per-caller state (auth, headers) and cannot be shared between users,
+# but the HTTPAdapter underneath them can: urllib3's pools are keyed by
+# host and thread-safe, so the public-API session and every per-user
+# mwclient session mount this adapter and ride the same keep-alive
+# connections.
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+)
+
+# Shared HTTP session for the unauthenticated public-API helpers.
+# Never passed to mwclient: authenticated Sites need per-user sessions.
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = 'django-oauth-wikimedia-task/1.0'
+_SESSION.mount('https://', _SHARED_ADAPTER)
+
+# (connect, read) timeouts for direct MediaWiki API calls.
+_REQUEST_TIMEOUT = (3.0, 10.0)
+
+# Constructed mwclient Sites, kept across requests so an editing session
+# reuses one Site (and its keep-alive connection) instead of paying the
+# siteinfo handshake every request. Keyed by (user_pk, wiki_url).
+# Expired entries are swept on insert and the size is bounded, so the
+# dict cannot grow without limit as distinct users come and go.
+SITE_CACHE_TTL = 600
+SITE_CACHE_MAX = 128
+_SITE_CACHE = {}
+_SITE_CACHE_LOCK = threading.Lock()
+
+# TTLs for cached MediaWiki API responses. Edit counts and groups move
+# on the order of minutes; contributions churn faster.
+USERINFO_CACHE_TTL = 120
+CONTRIBUTIONS_CACHE_TTL = 30
+
+# Base parameter sets for the MediaWiki Action API, copied and filled
+# with the username per call. Single source of truth for the prop lists.
+_USERS_PARAMS = {
+    'action': 'query',
+    'list': 'users',
+    'usprop': 'editcount|registration|groups',
+    'format': 'json'
+}
+_CONTRIBS_PARAMS = {
+    'action': 'query',
+    'list': 'usercontribs',
+    'ucprop': 'title|ids|timestamp|comment|size',
+    'format': 'json'
+}
+# Fallback userinfo payload when the API response is unusable. Copied
+# per return (with the name filled in, and a fresh groups list so the
+# copies share no mutable state) so callers can mutate the result.
+_EMPTY_USERINFO = {
+    'name': None,
+    'editcount': 0,
+    'registration': None,
+    'groups': ()
+}
+
+_PROFILE_PARAMS = {
+    'action': 'query',
+    'list': 'users|usercontribs',
+    'usprop': 'editcount|registration|groups',
+    'ucprop': 'title|ids|timestamp|comment|size',
+    'format': 'json',
+    'formatversion': 2
+}
+
+
+@lru_cache(maxsize=16)
+def _api_endpoint(wiki_url):
+    """
+    Memoized (api_url, host) pair for a wiki URL.
+
+    Nearly every caller uses the default wiki, so the urlparse and
+    f-string work is paid once per distinct URL instead of per request.
+    """
+    parsed = urlparse(wiki_url)
+    return f"{parsed.scheme}://{parsed.netloc}/w/api.php", parsed.netloc
+
+
+@lru_cache(maxsize=16)
+def _parse_wiki_url(wiki_url):
+    """
+    Split a wiki URL into (host, path, scheme) for mwclient.
+
+    Wikimedia sites use /w/ as the path to api.php. Results are cached
+    since the set of wiki URLs is tiny and immutable for the process.
+    """
+    parsed = urlparse(wiki_url)
+    return parsed.netloc, '/w/', parsed.scheme
+
+
+@lru_cache(maxsize=1)
+def _consumer_credentials():
+    """OAuth consumer key/secret from settings, read once per process."""
+    return (
+        settings.SOCIAL_AUTH_MEDIAWIKI_KEY,
+        settings.SOCIAL_AUTH_MEDIAWIKI_SECRET,
+    )
+
 
-def get_mwclient_for_user(user, wiki_url='https://meta.wikimedia.org'):
+def _get_mediawiki_username(user):
+    """
+    Resolve the MediaWiki username for a Django user.
+
+    The username comes from the user's social auth record and never
+    changes in practice, so it is cached per user to avoid re-querying
+    UserSocialAuth on every API helper call.
+
+    Args:
+        user: Django User object
+
+    Returns:
+        str: MediaWiki username (falls back to the Django username)
+    """
+    def _resolve():
+        try:
+            social_auth = UserSocialAuth.objects.get(
+                user=user, provider='mediawiki'
+            )
+            return social_auth.extra_data.get('username', user.username)
+        except UserSocialAuth.DoesNotExist:
+            return user.username
+
+    return cache.get_or_set(
+        f'mw:username:{user.pk}', _resolve, USERNAME_CACHE_TTL
+    )
+
+
+def get_mwclient_for_user(user, wiki_url='https://meta.wikimedia.org',
+                          request=None):
     """
     Get an OAuth-authenticated mwclient Site instance for a user.
 
     This function creates a NEW client instance for each call, avoiding
     the credential caching issues that Pywikibot has in multi-user environments.
+    When a request is supplied, the constructed Site is memoized on it so
+    several helpers within one view share a single instance instead of
+    each paying the social-auth query and site handshake.
 
     Args:
         user: Django User object with social auth credentials
         wiki_url: Full URL to the wiki (default: 'https://meta.wikimedia.org')
+        request: Optional HttpRequest used to memoize the Site per request
 
     Returns:
         mwclient.Site: Authenticated mwclient site instance
@@ -41,6 +195,28 @@ def get_mwclient_for_user(user, wiki_url='https://meta.wikimedia.org'):
         >>> page = site.pages['User:Example/Sandbox']
         >>> print(page.text())
     """
+    # Imported lazily: the hot profile-read helpers never touch mwclient,
+    # so workers that only serve reads skip its import cost entirely.
+    import mwclient
+
+    if request is not None:
+        site_cache = getattr(request, '_mwclient_cache', None)
+        if site_cache is None:
+            site_cache = request._mwclient_cache = {}
+        if wiki_url in site_cache:
+            return site_cache[wiki_url]
+
+    cache_key = (user.pk, wiki_url)
+    with _SITE_CACHE_LOCK:
+        entry = _SITE_CACHE.get(cache_key)
+        if entry is not None:
+            created, cached_site = entry
+            if time.monotonic() - created < SITE_CACHE_TTL:
+                if request is not None:
+                    request._mwclient_cache[wiki_url] = cached_site
+                return cached_site
+            del _SITE_CACHE[cache_key]
+
     try:
         social_auth = UserSocialAuth.objects.get(user=user, provider='mediawiki')
     except UserSocialAuth.DoesNotExist:
@@ -59,44 +235,83 @@ def get_mwclient_for_user(user, wiki_url='https://meta.wikimedia.org'):
             "OAuth access token or secret is missing from social auth data"
         )
 
-    # Extract host and path from wiki_url
     # Example: 'https://meta.wikimedia.org' -> host='meta.wikimedia.org', path='/w/'
-    from urllib.parse import urlparse
-    parsed = urlparse(wiki_url)
-    host = parsed.netloc
-    # Wikimedia sites use /w/ as the path to api.php
-    path = '/w/'
-    scheme = parsed.scheme
-
-    # Get OAuth consumer credentials from Django settings
-    from django.conf import settings
-    consumer_token = settings.SOCIAL_AUTH_MEDIAWIKI_KEY
-    consumer_secret = settings.SOCIAL_AUTH_MEDIAWIKI_SECRET
+    host, path, scheme = _parse_wiki_url(wiki_url)
+
+    consumer_token, consumer_secret = _consumer_credentials()
+
+    # mwclient only attaches OAuth credentials when it builds its own
+    # session; anything passed as pool= is used verbatim, so handing it
+    # the shared _SESSION silently dropped the signature and produced
+    # anonymous Sites. A shared session also could not hold per-user
+    # credentials without leaking them between users, so each Site gets
+    # its own session carrying this user's OAuth1 signature. _SESSION
+    # stays reserved for the unauthenticated public-API helpers.
+    from requests_oauthlib import OAuth1
+
+    session = requests.Session()
+    session.auth = OAuth1(
+        consumer_token, consumer_secret, oauth_token, oauth_token_secret
+    )
+    session.headers['User-Agent'] = _SESSION.headers['User-Agent']
+    session.mount('https://', _SHARED_ADAPTER)
 
-    # Create mwclient Site instance with OAuth 1.0a
     site = mwclient.Site(
         host=host,
         path=path,
         scheme=scheme,
-        consumer_token=consumer_token,
-        consumer_secret=consumer_secret,
-        access_token=oauth_token,
-        access_secret=oauth_token_secret
+        pool=session
     )
 
+    with _SITE_CACHE_LOCK:
+        now = time.monotonic()
+        for key in [
+            k for k, (created, _) in _SITE_CACHE.items()
+            if now - created >= SITE_CACHE_TTL
+        ]:
+            del _SITE_CACHE[key]
+        while len(_SITE_CACHE) >= SITE_CACHE_MAX:
+            # Dicts iterate in insertion order, so the first key is the
+            # oldest surviving entry.
+            del _SITE_CACHE[next(iter(_SITE_CACHE))]
+        _SITE_CACHE[cache_key] = (now, site)
+
+    if request is not None:
+        request._mwclient_cache[wiki_url] = site
+
     return site
 
 
-def get_user_info(user, wiki_url='https://meta.wikimedia.org'):
+def _evict_cached_sites(sender, request, user, **kwargs):
+    """Drop a user's cached Sites when they log out."""
+    if user is None:
+        return
+    with _SITE_CACHE_LOCK:
+        for key in [k for k in _SITE_CACHE if k[0] == user.pk]:
+            del _SITE_CACHE[key]
+
+
+user_logged_out.connect(
+    _evict_cached_sites, dispatch_uid='mwclient_utils.evict_cached_sites'
+)
+
+
+def get_user_info(user, wiki_url='https://meta.wikimedia.org', username=None,
+                  force_refresh=False):
     """
     Get user information including edit count using public API (no OAuth needed).
 
     This function uses the public MediaWiki API to fetch user data.
     OAuth is not needed since this information is publicly available.
+    Responses are cached briefly per username and wiki, so repeated
+    dashboard polls are served from the cache instead of the live API.
 
     Args:
         user: Django User object with social auth credentials
         wiki_url: Full URL to the wiki (default: 'https://meta.wikimedia.org')
+        username: MediaWiki username, if the caller has already resolved
+            it; skips the social-auth lookup
+        force_refresh: Bypass the cache (e.g. for explicit refresh buttons)
 
     Returns:
         dict: User information including:
@@ -109,61 +324,64 @@ def get_user_info(user, wiki_url='https://meta.wikimedia.org'):
         >>> info = get_user_info(request.user)
         >>> print(f"Edit count: {info['editcount']}")
     """
-    # Get the Wikimedia username from social auth
-    from social_django.models import UserSocialAuth
-    try:
-        social_auth = UserSocialAuth.objects.get(user=user, provider='mediawiki')
-        username = social_auth.extra_data.get('username', user.username)
-    except UserSocialAuth.DoesNotExist:
-        username = user.username
+    # Get the Wikimedia username from social auth (cached per user)
+    if username is None:
+        username = _get_mediawiki_username(user)
 
     # Use public API (no OAuth) to get user info
-    from urllib.parse import urlparse
-    import requests
+    api_url, host = _api_endpoint(wiki_url)
 
-    parsed = urlparse(wiki_url)
-    api_url = f"{parsed.scheme}://{parsed.netloc}/w/api.php"
+    cache_key = f'mw:userinfo:{host}:{username}'
+    if not force_refresh:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-    params = {
-        'action': 'query',
-        'list': 'users',
-        'ususers': username,
-        'usprop': 'editcount|registration|groups',
-        'format': 'json'
-    }
+    params = {**_USERS_PARAMS, 'ususers': username}
 
-    response = requests.get(api_url, params=params)
-    data = response.json()
+    # A slow or unreachable upstream degrades to the fallback payload
+    # rather than hanging the worker or surfacing a 500.
+    try:
+        response = _SESSION.get(api_url, params=params, timeout=_REQUEST_TIMEOUT)
+        data = orjson.loads(response.content)
+    except requests.RequestException:
+        data = {}
 
-    if 'query' in data and 'users' in data['query'] and len(data['query']['users']) > 0:
+    # Direct subscripting with a cold exception path beats chained
+    # membership checks on the hot path.
+    try:
         user_data = data['query']['users'][0]
-        return {
-            'name': user_data.get('name', username),
-            'editcount': user_data.get('editcount', 0),
-            'registration': user_data.get('registration'),
-            'groups': user_data.get('groups', [])
-        }
-
-    # Fallback if API call fails
-    return {
-        'name': username,
-        'editcount': 0,
-        'registration': None,
-        'groups': []
+    except (KeyError, IndexError):
+        # Fallback if API call fails
+        return {**_EMPTY_USERINFO, 'name': username, 'groups': []}
+
+    user_info = {
+        'name': user_data.get('name', username),
+        'editcount': user_data.get('editcount', 0),
+        'registration': user_data.get('registration'),
+        'groups': user_data.get('groups', [])
     }
+    cache.set(cache_key, user_info, USERINFO_CACHE_TTL)
+    return user_info
 
 
-def get_user_contributions(user, total=10, wiki_url='https://meta.wikimedia.org'):
+def get_user_contributions(user, total=10, wiki_url='https://meta.wikimedia.org',
+                           username=None, force_refresh=False):
     """
     Get recent contributions for a user using public API (no OAuth needed).
 
     This function uses the public MediaWiki API to fetch user contributions.
     OAuth is not needed since contributions are publicly visible.
+    Responses are cached for a short TTL per username, wiki and total,
+    since contributions change faster than user info.
 
     Args:
         user: Django User object with social auth credentials
         total: Maximum number of contributions to retrieve (default: 10)
         wiki_url: Full URL to the wiki (default: 'https://meta.wikimedia.org')
+        username: MediaWiki username, if the caller has already resolved
+            it; skips the social-auth lookup
+        force_refresh: Bypass the cache (e.g. for explicit refresh buttons)
 
     Returns:
         list: List of contribution dictionaries containing:
@@ -178,45 +396,115 @@ def get_user_contributions(user, total=10, wiki_url='https://meta.wikimedia.org'
         >>> for contrib in contribs:
         ...     print(f"{contrib['title']}: {contrib['comment']}")
     """
-    # Get the Wikimedia username from social auth
-    from social_django.models import UserSocialAuth
-    try:
-        social_auth = UserSocialAuth.objects.get(user=user, provider='mediawiki')
-        username = social_auth.extra_data.get('username', user.username)
-    except UserSocialAuth.DoesNotExist:
-        username = user.username
+    # Get the Wikimedia username from social auth (cached per user)
+    if username is None:
+        username = _get_mediawiki_username(user)
 
     # Use public API (no OAuth) to get contributions
-    from urllib.parse import urlparse
-    import requests
+    api_url, host = _api_endpoint(wiki_url)
 
-    parsed = urlparse(wiki_url)
-    api_url = f"{parsed.scheme}://{parsed.netloc}/w/api.php"
+    cache_key = f'mw:usercontribs:{host}:{username}:{total}'
+    if not force_refresh:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    params = {**_CONTRIBS_PARAMS, 'ucuser': username, 'uclimit': total}
+
+    # A slow or unreachable upstream degrades to an empty list rather
+    # than hanging the worker or surfacing a 500.
+    try:
+        response = _SESSION.get(api_url, params=params, timeout=_REQUEST_TIMEOUT)
+        data = orjson.loads(response.content)
+    except requests.RequestException:
+        data = {}
+
+    try:
+        raw_contribs = data['query']['usercontribs']
+    except KeyError:
+        return []
+
+    contributions = [
+        {
+            'title': contrib.get('title'),
+            'revid': contrib.get('revid'),
+            'timestamp': contrib.get('timestamp'),
+            'comment': contrib.get('comment', ''),
+            'size': contrib.get('size', 0)
+        }
+        for contrib in raw_contribs
+    ]
+    cache.set(cache_key, contributions, CONTRIBUTIONS_CACHE_TTL)
+
+    return contributions
+
+
+def get_user_profile_data(user, total=10, wiki_url='https://meta.wikimedia.org'):
+    """
+    Fetch user info and recent contributions in one API request.
+
+    MediaWiki's action=query accepts multiple list modules per request,
+    so user info and contributions are combined into a single HTTP call
+    rather than two round trips. formatversion=2 is requested so the
+    response uses flat lists and native booleans instead of the legacy
+    dict-keyed structure.
+
+    Args:
+        user: Django User object with social auth credentials
+        total: Maximum number of contributions to retrieve (default: 10)
+        wiki_url: Full URL to the wiki (default: 'https://meta.wikimedia.org')
+
+    Returns:
+        tuple: (user_info dict, contributions list) as returned by
+        get_user_info and get_user_contributions
+
+    Example:
+        >>> info, contribs = get_user_profile_data(request.user, total=5)
+        >>> print(f"{info['name']} has {info['editcount']} edits")
+    """
+    # Get the Wikimedia username from social auth (cached per user)
+    username = _get_mediawiki_username(user)
+
+    api_url, _ = _api_endpoint(wiki_url)
 
     params = {
-        'action': 'query',
-        'list': 'usercontribs',
+        **_PROFILE_PARAMS,
+        'ususers': username,
         'ucuser': username,
-        'uclimit': total,
-        'ucprop': 'title|ids|timestamp|comment|size',
-        'format': 'json'
+        'uclimit': total
     }
 
-    response = requests.get(api_url, params=params)
-    data = response.json()
-
-    contributions = []
-    if 'query' in data and 'usercontribs' in data['query']:
-        for contrib in data['query']['usercontribs']:
-            contributions.append({
-                'title': contrib.get('title'),
-                'revid': contrib.get('revid'),
-                'timestamp': contrib.get('timestamp'),
-                'comment': contrib.get('comment', ''),
-                'size': contrib.get('size', 0)
-            })
+    try:
+        response = _SESSION.get(api_url, params=params, timeout=_REQUEST_TIMEOUT)
+        data = orjson.loads(response.content)
+    except requests.RequestException:
+        data = {}
+    query = data.get('query', {})
+
+    users = query.get('users', [])
+    if users:
+        user_data = users[0]
+        user_info = {
+            'name': user_data.get('name', username),
+            'editcount': user_data.get('editcount', 0),
+            'registration': user_data.get('registration'),
+            'groups': user_data.get('groups', [])
+        }
+    else:
+        user_info = {**_EMPTY_USERINFO, 'name': username, 'groups': []}
+
+    contributions = [
+        {
+            'title': contrib.get('title'),
+            'revid': contrib.get('revid'),
+            'timestamp': contrib.get('timestamp'),
+            'comment': contrib.get('comment', ''),
+            'size': contrib.get('size', 0)
+        }
+        for contrib in query.get('usercontribs', [])
+    ]
 
-    return contributions
+    return user_info, contributions
 
 
 def make_edit_as_user(user, page_title, new_text, summary, wiki_url='https://meta.wikimedia.org'):
@@ -246,6 +534,8 @@ def make_edit_as_user(user, page_title, new_text, summary, wiki_url='https://met
         >>> if result['success']:
         ...     print(f"Edit successful! Revision: {result['revid']}")
     """
+    import mwclient
+
     try:
         site = get_mwclient_for_user(user, wiki_url)
         page = site.pages[page_title]
@@ -274,10 +564,16 @@ def make_edit_as_user(user, page_title, new_text, summary, wiki_url='https://met
 
 def get_page_content(user, page_title, wiki_url='https://meta.wikimedia.org'):
     """
-    Get the content of a wiki page using the user's OAuth credentials.
+    Get the content of a wiki page using the public API (no OAuth needed).
+
+    Page content is publicly readable, so this is a single action=query
+    call on the shared session instead of constructing an mwclient Site,
+    which pays an implicit siteinfo probe before the first page fetch.
+    Existence, content, revision ID and length all come back in the one
+    response.
 
     Args:
-        user: Django User object with social auth credentials
+        user: Django User object (kept for signature compatibility)
         page_title: Title of the page to retrieve
         wiki_url: Full URL to the wiki (default: 'https://meta.wikimedia.org')
 
@@ -293,12 +589,42 @@ def get_page_content(user, page_title, wiki_url='https://meta.wikimedia.org'):
         >>> if page_data['exists']:
         ...     print(page_data['text'])
     """
-    site = get_mwclient_for_user(user, wiki_url)
-    page = site.pages[page_title]
+    api_url, _ = _api_endpoint(wiki_url)
+
+    params = {
+        'action': 'query',
+        'titles': page_title,
+        'prop': 'revisions|info',
+        'rvprop': 'content|ids',
+        'rvslots': 'main',
+        'format': 'json',
+        'formatversion': 2
+    }
+
+    try:
+        response = _SESSION.get(api_url, params=params, timeout=_REQUEST_TIMEOUT)
+        data = orjson.loads(response.content)
+    except requests.RequestException:
+        data = {}
+
+    pages = data.get('query', {}).get('pages', [])
+    page = pages[0] if pages else {}
+
+    if not page or page.get('missing'):
+        return {
+            'exists': False,
+            'text': '',
+            'revision': None,
+            'length': 0
+        }
+
+    revisions = page.get('revisions', [])
+    revision = revisions[0] if revisions else {}
+    text = revision.get('slots', {}).get('main', {}).get('content', '')
 
     return {
-        'exists': page.exists,
-        'text': page.text() if page.exists else '',
-        'revision': page.revision if page.exists else None,
-        'length': page.length if page.exists else 0
+        'exists': True,
+        'text': text,
+        'revision': revision.get('revid'),
+        'length': page.get('length', len(text))
     }
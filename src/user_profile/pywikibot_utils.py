@@ -23,6 +23,12 @@ This module is kept for:
 - Single-user/testing scenarios
 - Non-OAuth Pywikibot operations (like reading wiki replicas)
 
+⚠️ NEVER IMPORT THIS MODULE FROM WEB-WORKER CODE ⚠️
+Importing it pulls in pywikibot, whose package init loads dozens of
+modules (hundreds of ms of startup time and resident memory per worker)
+and establishes the global credential state described above. It must
+only be imported from standalone scripts; web views use mwclient_utils.
+
 See: https://github.com/Wikimedia-Suomi/PendingChangesBot-ng discussions
 Credit: Issue discovered by Zache during Outreachy internship
 """
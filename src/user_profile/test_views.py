@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from django.urls import reverse
 
@@ -98,3 +100,12 @@ class TestLanguageSwitcher:
             'next': '/'
         })
         assert response.status_code == 302
+
+
+@pytest.mark.unit
+class TestPywikibotIsolation:
+    """Tests that pywikibot stays out of the web worker import graph."""
+
+    def test_pywikibot_not_imported(self):
+        """Test that importing the web stack never pulls in pywikibot."""
+        assert 'pywikibot' not in sys.modules
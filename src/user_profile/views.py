@@ -1,16 +1,24 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.utils.translation import activate
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from django.conf import settings
-from social_django.models import UserSocialAuth
-
-# Use mwclient for production (thread-safe for multi-user apps)
-from .mwclient_utils import get_user_info, get_user_contributions
 
 # Pywikibot is kept for reference but has multi-user limitations
 # from .pywikibot_utils import get_user_edit_count, get_user_contributions
 
+# Valid language codes, computed once at import time. settings.LANGUAGES
+# cannot change without a process restart, so there is no need to rebuild
+# a dict from it on every language-switch request.
+_VALID_LANGUAGE_CODES = frozenset(code for code, _ in settings.LANGUAGES)
+
 
+# The public pages are near-static template renders; cache the generated
+# HTML so repeat hits skip template rendering entirely. Responses vary on
+# Cookie because the shared base template shows the login state.
+@cache_page(60 * 5)
+@vary_on_cookie
 def index(request):
     context = {}
     return render(request, 'user_profile/index.dtl', context)
@@ -24,11 +32,15 @@ def profile(request):
     return render(request, 'user_profile/profile_vue.dtl')
 
 
+@cache_page(60 * 5)
+@vary_on_cookie
 def login_oauth(request):
     context = {}
     return render(request, 'user_profile/login.dtl', context)
 
 
+@cache_page(60)
+@vary_on_cookie
 def search(request):
     """
     Vue-powered search page for wiki replica database.
@@ -36,6 +48,8 @@ def search(request):
     return render(request, 'user_profile/search_vue.dtl')
 
 
+@cache_page(60)
+@vary_on_cookie
 def statistics(request):
     """
     Vue-powered statistics dashboard showing wiki database stats.
@@ -43,20 +57,13 @@ def statistics(request):
     return render(request, 'user_profile/statistics.dtl')
 
 
-def profile_vue(request):
-    """
-    Vue-powered profile page that fetches data from API.
-    """
-    return render(request, 'user_profile/profile_vue.dtl')
-
-
 def set_language(request):
     """
     Change the user's language preference.
     """
     if request.method == 'POST':
         language = request.POST.get('language')
-        if language and language in dict(settings.LANGUAGES).keys():
+        if language and language in _VALID_LANGUAGE_CODES:
             activate(language)
             response = redirect(request.POST.get('next', '/'))
             response.set_cookie(settings.LANGUAGE_COOKIE_NAME, language)
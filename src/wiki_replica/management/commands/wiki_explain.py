@@ -0,0 +1,69 @@
+"""
+Print the replica's execution plan for a utility-function queryset.
+
+Usage:
+    python manage.py wiki_explain search_pages Helsinki
+    python manage.py wiki_explain namespace_pages 4 --analyze
+
+Only available with DEBUG on, so ANALYZE (which really executes the
+query) cannot be run against production by accident.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from wiki_replica import utils
+
+# Maps a command-line name to a builder returning the queryset the
+# matching utility function would execute.
+QUERYSET_BUILDERS = {
+    'recent_changes': lambda args: utils.get_recent_changes(),
+    'page_revisions': lambda args: utils.get_page_revisions(int(args[0])),
+    'namespace_pages': lambda args: utils.get_namespace_pages(
+        int(args[0]) if args else 0
+    ),
+    'search_pages': lambda args: utils.search_pages(args[0]),
+    'log_entries': lambda args: utils.get_log_entries(
+        args[0] if args else None
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = "Show the replica query plan for a wiki_replica utility function."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'function', choices=sorted(QUERYSET_BUILDERS),
+            help='Utility function whose queryset should be explained'
+        )
+        parser.add_argument(
+            'fn_args', nargs='*',
+            help='Positional arguments for the utility function'
+        )
+        parser.add_argument(
+            '--format', dest='plan_format', default=None,
+            help='Backend-specific plan format, e.g. JSON'
+        )
+        parser.add_argument(
+            '--analyze', action='store_true',
+            help='Execute the query and report real timings'
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG:
+            raise CommandError('wiki_explain is only available with DEBUG on.')
+
+        function = options['function']
+        try:
+            queryset = QUERYSET_BUILDERS[function](options['fn_args'])
+        except (IndexError, ValueError) as exc:
+            raise CommandError(
+                f'Bad arguments for {function}: {exc}'
+            )
+
+        self.stdout.write(utils.explain_queryset(
+            queryset,
+            format=options['plan_format'],
+            analyze=options['analyze'],
+        ))
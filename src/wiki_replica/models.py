@@ -8,9 +8,42 @@ Note: These are managed=False models, meaning Django won't create/modify
 the tables. They're read-only representations of existing wiki tables.
 """
 
+from datetime import datetime
+
 from django.db import models
 
 
+class TimestampField(models.CharField):
+    """
+    MediaWiki binary(14) timestamp column (YYYYMMDDHHMMSS).
+
+    Rows surface the value as a naive UTC datetime instead of a string,
+    saving callers a per-row strptime. Filters and ordering still
+    compare the underlying zero-padded strings — lexical order is
+    chronological order — so the replica's indexes keep working, and
+    datetime filter values are converted back on the way in.
+    """
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, datetime):
+            return value
+        value = str(value)
+        if len(value) == 14 and value.isdigit():
+            return datetime(
+                int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                int(value[8:10]), int(value[10:12]), int(value[12:14]),
+            )
+        return value
+
+    def get_prep_value(self, value):
+        if isinstance(value, datetime):
+            return value.strftime('%Y%m%d%H%M%S')
+        return super().get_prep_value(value)
+
+
 class Page(models.Model):
     """
     Represents the MediaWiki 'page' table.
@@ -22,8 +55,8 @@ class Page(models.Model):
     page_is_redirect = models.BooleanField(default=False)
     page_is_new = models.BooleanField(default=False)
     page_random = models.FloatField()
-    page_touched = models.CharField(max_length=14)
-    page_links_updated = models.CharField(max_length=14, null=True, blank=True)
+    page_touched = TimestampField(max_length=14)
+    page_links_updated = TimestampField(max_length=14, null=True, blank=True)
     page_latest = models.IntegerField()
     page_len = models.IntegerField()
     page_content_model = models.CharField(max_length=32, null=True, blank=True)
@@ -33,6 +66,15 @@ class Page(models.Model):
         managed = False  # Don't let Django manage this table
         db_table = 'page'  # Use existing wiki table
         app_label = 'wiki_replica'
+        # Mirrors the replica's physical indexes so readers (and the ORM
+        # planner assumptions) know which access paths exist. With
+        # managed=False Django never emits DDL for these.
+        indexes = [
+            models.Index(
+                fields=['page_namespace', '-page_touched'],
+                name='idx_page_ns_touched',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.page_namespace}:{self.page_title}"
@@ -44,10 +86,19 @@ class Revision(models.Model):
     Contains all revisions made to wiki pages.
     """
     rev_id = models.AutoField(primary_key=True)
-    rev_page = models.IntegerField()
+    # Declared as FKs (without DB constraints — the replica has none for
+    # Django to rely on) so the admin and callers can select_related
+    # instead of resolving pages and actors row by row.
+    rev_page = models.ForeignKey(
+        'Page', db_column='rev_page', db_constraint=False,
+        on_delete=models.DO_NOTHING, related_name='+'
+    )
     rev_comment_id = models.BigIntegerField()
-    rev_actor = models.BigIntegerField()
-    rev_timestamp = models.CharField(max_length=14)
+    rev_actor = models.ForeignKey(
+        'Actor', db_column='rev_actor', db_constraint=False,
+        on_delete=models.DO_NOTHING, related_name='+'
+    )
+    rev_timestamp = TimestampField(max_length=14)
     rev_minor_edit = models.BooleanField(default=False)
     rev_deleted = models.SmallIntegerField(default=0)
     rev_len = models.IntegerField(null=True, blank=True)
@@ -58,6 +109,12 @@ class Revision(models.Model):
         managed = False
         db_table = 'revision'
         app_label = 'wiki_replica'
+        indexes = [
+            models.Index(
+                fields=['rev_page', '-rev_timestamp'],
+                name='idx_rev_page_timestamp',
+            ),
+        ]
 
     def __str__(self):
         return f"Revision {self.rev_id}"
@@ -90,12 +147,12 @@ class User(models.Model):
     user_name = models.CharField(max_length=255, unique=True)
     user_real_name = models.CharField(max_length=255, blank=True)
     user_email = models.CharField(max_length=255, blank=True)
-    user_touched = models.CharField(max_length=14)
+    user_touched = TimestampField(max_length=14)
     user_token = models.CharField(max_length=32)
     user_email_authenticated = models.CharField(max_length=14, null=True, blank=True)
     user_email_token = models.CharField(max_length=32, null=True, blank=True)
     user_email_token_expires = models.CharField(max_length=14, null=True, blank=True)
-    user_registration = models.CharField(max_length=14, null=True, blank=True)
+    user_registration = TimestampField(max_length=14, null=True, blank=True)
     user_editcount = models.IntegerField(null=True, blank=True)
 
     class Meta:
@@ -115,8 +172,11 @@ class Logging(models.Model):
     log_id = models.AutoField(primary_key=True)
     log_type = models.CharField(max_length=32)
     log_action = models.CharField(max_length=32)
-    log_timestamp = models.CharField(max_length=14)
-    log_actor = models.BigIntegerField()
+    log_timestamp = TimestampField(max_length=14)
+    log_actor = models.ForeignKey(
+        'Actor', db_column='log_actor', db_constraint=False,
+        on_delete=models.DO_NOTHING, related_name='+'
+    )
     log_namespace = models.IntegerField()
     log_title = models.CharField(max_length=255)
     log_page = models.IntegerField(null=True, blank=True)
@@ -128,19 +188,50 @@ class Logging(models.Model):
         managed = False
         db_table = 'logging'
         app_label = 'wiki_replica'
+        indexes = [
+            models.Index(
+                fields=['log_type', '-log_timestamp'],
+                name='idx_log_type_timestamp',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.log_type}:{self.log_action} - {self.log_id}"
 
 
+class SiteStats(models.Model):
+    """
+    Represents the MediaWiki 'site_stats' table.
+    A single pre-aggregated row of site-wide statistics.
+    """
+    ss_row_id = models.AutoField(primary_key=True)
+    ss_total_edits = models.BigIntegerField(null=True, blank=True)
+    ss_good_articles = models.BigIntegerField(null=True, blank=True)
+    ss_total_pages = models.BigIntegerField(null=True, blank=True)
+    ss_users = models.BigIntegerField(null=True, blank=True)
+    ss_active_users = models.BigIntegerField(null=True, blank=True)
+    ss_images = models.BigIntegerField(null=True, blank=True)
+
+    class Meta:
+        managed = False
+        db_table = 'site_stats'
+        app_label = 'wiki_replica'
+
+    def __str__(self):
+        return f"SiteStats {self.ss_row_id}"
+
+
 class RecentChanges(models.Model):
     """
     Represents the MediaWiki 'recentchanges' table.
     Contains recent changes to the wiki (rolling window).
     """
     rc_id = models.AutoField(primary_key=True)
-    rc_timestamp = models.CharField(max_length=14)
-    rc_actor = models.BigIntegerField()
+    rc_timestamp = TimestampField(max_length=14)
+    rc_actor = models.ForeignKey(
+        'Actor', db_column='rc_actor', db_constraint=False,
+        on_delete=models.DO_NOTHING, related_name='+'
+    )
     rc_namespace = models.IntegerField()
     rc_title = models.CharField(max_length=255)
     rc_comment_id = models.BigIntegerField()
@@ -166,6 +257,12 @@ class RecentChanges(models.Model):
         managed = False
         db_table = 'recentchanges'
         app_label = 'wiki_replica'
+        indexes = [
+            models.Index(
+                fields=['-rc_timestamp'],
+                name='idx_rc_timestamp',
+            ),
+        ]
 
     def __str__(self):
         return f"RC {self.rc_id}: {self.rc_namespace}:{self.rc_title}"
@@ -5,69 +5,161 @@ These functions provide convenient access to wiki data through
 Django ORM models mapped to MediaWiki database tables.
 """
 
+import hashlib
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Count, Q
+
 from .models import Page, Revision, Actor, User, RecentChanges, Logging
 
+# How long computed page statistics stay cached. The replica itself lags
+# the live wiki, so serving slightly stale counts is already the norm.
+PAGE_STATS_CACHE_KEY = 'wiki_replica:page_stats:v1'
+PAGE_STATS_TTL = getattr(settings, 'WIKI_REPLICA_STATS_TTL', 300)
+
+# TTLs for the point-lookup read-through caches. Rows on the replica
+# only move when it syncs, so short TTLs trade little staleness for
+# skipping cross-DC round trips on the hot login/view-page paths.
+PAGE_CACHE_TTL = 120
+USER_CACHE_TTL = 300
+
+
+def _lookup_cache_key(kind, value):
+    """Bounded cache key for a point lookup; long values are hashed."""
+    if len(value) > 100:
+        value = hashlib.blake2b(
+            value.encode('utf-8'), digest_size=16
+        ).hexdigest()
+    return f'wiki_replica:{kind}:{value}'
+
+
+def _cached_instance(model, key, fetch, ttl):
+    """
+    Read-through helper: serve a model instance from cached field values,
+    falling back to fetch() and caching its columns on a miss. Misses
+    (None) are not cached.
+    """
+    data = cache.get(key)
+    if data is not None:
+        return model(**data)
+
+    obj = fetch()
+    if obj is not None:
+        cache.set(
+            key,
+            {f.attname: getattr(obj, f.attname) for f in model._meta.fields},
+            ttl,
+        )
+    return obj
+
 
-def get_recent_changes(limit=10):
+def get_recent_changes(limit=10, fields=None):
     """
     Get recent changes from the wiki.
 
     Args:
         limit: Maximum number of recent changes to retrieve
+        fields: Optional field names to load; defaults to the columns the
+            listing UIs actually display, keeping the wide rc_params
+            blob out of the result set
 
     Returns:
         QuerySet of RecentChanges objects
     """
-    return RecentChanges.objects.all().order_by('-rc_timestamp')[:limit]
+    if fields is None:
+        fields = (
+            'rc_id', 'rc_timestamp', 'rc_namespace', 'rc_title',
+            'rc_type', 'rc_bot', 'rc_actor'
+        )
+    return RecentChanges.objects.only(*fields).order_by('-rc_timestamp')[:limit]
 
 
-def get_page_by_title(title, namespace=0):
+def get_page_by_title(title, namespace=0, fields=None):
     """
     Get a page by its title and namespace.
 
+    Full-row lookups are served through a short-TTL cache so hot titles
+    skip the cross-DC round trip; passing fields bypasses the cache and
+    queries the replica directly.
+
     Args:
         title: Page title
         namespace: Namespace ID (default: 0 for main namespace)
+        fields: Optional field names to load instead of every column
 
     Returns:
         Page object or None
     """
-    try:
-        return Page.objects.get(page_title=title, page_namespace=namespace)
-    except Page.DoesNotExist:
-        return None
+    def fetch(queryset=Page.objects.only(*fields) if fields else Page.objects):
+        try:
+            return queryset.get(page_title=title, page_namespace=namespace)
+        except Page.DoesNotExist:
+            return None
+
+    if fields:
+        return fetch()
+
+    key = _lookup_cache_key('page', f'{namespace}:{title}')
+    return _cached_instance(Page, key, fetch, PAGE_CACHE_TTL)
 
 
-def get_page_revisions(page_id, limit=10):
+def get_page_revisions(page_id, limit=10, fields=None):
     """
     Get revisions for a specific page.
 
     Args:
         page_id: The page ID
         limit: Maximum number of revisions to retrieve
+        fields: Optional field names to load instead of every column
 
     Returns:
         QuerySet of Revision objects
     """
-    return Revision.objects.filter(
-        rev_page=page_id
-    ).order_by('-rev_timestamp')[:limit]
+    queryset = Revision.objects.filter(rev_page=page_id)
+    if fields:
+        queryset = queryset.only(*fields)
+    return queryset.order_by('-rev_timestamp')[:limit]
 
 
-def get_user_by_name(username):
+def get_user_by_name(username, fields=None):
     """
     Get a user by their username.
 
+    Full-row lookups are served through a short-TTL cache so hot
+    usernames skip the cross-DC round trip; passing fields bypasses the
+    cache and queries the replica directly.
+
     Args:
         username: The username to search for
+        fields: Optional field names to load instead of every column
 
     Returns:
         User object or None
     """
-    try:
-        return User.objects.get(user_name=username)
-    except User.DoesNotExist:
-        return None
+    def fetch(queryset=User.objects.only(*fields) if fields else User.objects):
+        try:
+            return queryset.get(user_name=username)
+        except User.DoesNotExist:
+            return None
+
+    if fields:
+        return fetch()
+
+    key = _lookup_cache_key('user', username)
+    return _cached_instance(User, key, fetch, USER_CACHE_TTL)
+
+
+def invalidate_page_cache(title, namespace=0):
+    """Drop a cached page lookup (e.g. when replica lag is detected)."""
+    cache.delete(_lookup_cache_key('page', f'{namespace}:{title}'))
+
+
+def invalidate_user_cache(username):
+    """Drop a cached user lookup (e.g. when replica lag is detected)."""
+    cache.delete(_lookup_cache_key('user', username))
 
 
 def get_user_edit_count_from_db(username):
@@ -80,44 +172,85 @@ def get_user_edit_count_from_db(username):
     Returns:
         int: Edit count or None if user not found
     """
-    user = get_user_by_name(username)
-    if user:
-        return user.user_editcount
-    return None
+    # Single-column SELECT: no wide varchar columns over the wire and no
+    # User instance built just to read one integer.
+    return User.objects.filter(
+        user_name=username
+    ).values_list('user_editcount', flat=True).first()
 
 
-def get_namespace_pages(namespace=0, limit=100):
+def get_namespace_pages(namespace=0, limit=100, fields=None):
     """
     Get pages from a specific namespace.
 
     Args:
         namespace: Namespace ID
         limit: Maximum number of pages to retrieve
+        fields: Optional field names to load instead of every column
 
     Returns:
         QuerySet of Page objects
     """
-    return Page.objects.filter(
-        page_namespace=namespace
-    ).order_by('-page_touched')[:limit]
+    queryset = Page.objects.filter(page_namespace=namespace)
+    if fields:
+        queryset = queryset.only(*fields)
+    return queryset.order_by('-page_touched')[:limit]
+
+
+def iter_namespace_pages(namespace=0, chunk_size=2000, fields=None):
+    """
+    Stream every page in a namespace without materializing the result.
+
+    Unlike get_namespace_pages, which is meant for bounded listings,
+    this walks the whole namespace via .iterator(), keeping resident
+    memory at O(chunk_size) regardless of how many rows come back.
+    Intended for batch jobs and exports.
+
+    Args:
+        namespace: Namespace ID
+        chunk_size: Rows fetched per database round trip
+        fields: Optional field names to load instead of every column
+
+    Returns:
+        Iterator of Page objects
+    """
+    queryset = Page.objects.filter(page_namespace=namespace)
+    if fields:
+        queryset = queryset.only(*fields)
+    return queryset.order_by('page_id').iterator(chunk_size=chunk_size)
 
 
-def search_pages(search_term, namespace=0, limit=20):
+def search_pages(search_term, namespace=0, limit=20, fields=None):
     """
-    Search for pages by title (simple LIKE search).
+    Search for pages by title.
+
+    Terms of three or more characters are matched as prefixes
+    (istartswith), which the replica's (page_namespace, page_title)
+    index can serve as an index probe. Shorter terms keep the old
+    substring LIKE, which inevitably scans. A trigram or FULLTEXT index
+    would make substring search indexable, but the replica is read-only
+    for us, so we cannot create one.
 
     Args:
         search_term: Search string
         namespace: Namespace ID to search in
         limit: Maximum results
+        fields: Optional field names to load instead of every column
 
     Returns:
         QuerySet of Page objects
     """
-    return Page.objects.filter(
-        page_title__icontains=search_term,
-        page_namespace=namespace
-    )[:limit]
+    if len(search_term) >= 3:
+        title_filter = {'page_title__istartswith': search_term}
+    else:
+        title_filter = {'page_title__icontains': search_term}
+
+    queryset = Page.objects.filter(
+        page_namespace=namespace, **title_filter
+    )
+    if fields:
+        queryset = queryset.only(*fields)
+    return queryset[:limit]
 
 
 def get_log_entries(log_type=None, limit=10):
@@ -139,36 +272,179 @@ def get_log_entries(log_type=None, limit=10):
     return queryset.order_by('-log_timestamp')[:limit]
 
 
-def get_actor_by_name(actor_name):
+def get_actor_by_name(actor_name, fields=None):
     """
     Get an actor by name.
 
     Args:
         actor_name: The actor's name
+        fields: Optional field names to load instead of every column
 
     Returns:
         Actor object or None
     """
+    queryset = Actor.objects.only(*fields) if fields else Actor.objects
     try:
-        return Actor.objects.get(actor_name=actor_name)
+        return queryset.get(actor_name=actor_name)
     except Actor.DoesNotExist:
         return None
 
 
+def get_pages_by_titles(titles, namespace=0, fields=None):
+    """
+    Get several pages in one query.
+
+    The canonical N+1 fix: callers that would otherwise loop over
+    get_page_by_title issue a single page_title__in query instead.
+
+    Args:
+        titles: Iterable of page titles
+        namespace: Namespace ID the titles live in
+        fields: Optional field names to load instead of every column
+
+    Returns:
+        dict: {page_title: Page} for the titles that exist
+    """
+    queryset = Page.objects.filter(
+        page_title__in=list(titles), page_namespace=namespace
+    )
+    if fields:
+        queryset = queryset.only(*fields)
+    return {page.page_title: page for page in queryset}
+
+
+def get_users_by_names(names, fields=None):
+    """
+    Get several users in one query.
+
+    Args:
+        names: Iterable of usernames
+        fields: Optional field names to load instead of every column
+
+    Returns:
+        dict: {user_name: User} for the users that exist
+    """
+    queryset = User.objects.filter(user_name__in=list(names))
+    if fields:
+        queryset = queryset.only(*fields)
+    return {user.user_name: user for user in queryset}
+
+
+def get_actors_by_names(names, fields=None):
+    """
+    Get several actors in one query.
+
+    Args:
+        names: Iterable of actor names
+        fields: Optional field names to load instead of every column
+
+    Returns:
+        dict: {actor_name: Actor} for the actors that exist
+    """
+    queryset = Actor.objects.filter(actor_name__in=list(names))
+    if fields:
+        queryset = queryset.only(*fields)
+    return {actor.actor_name: actor for actor in queryset}
+
+
+def explain_queryset(queryset, format=None, analyze=False):
+    """
+    Return the database's execution plan for a queryset.
+
+    Thin wrapper over QuerySet.explain() so callers (and the
+    wiki_explain management command) can check that replica queries hit
+    the expected indexes without writing ad-hoc raw SQL. analyze is only
+    passed through when requested since not every backend supports it.
+
+    Args:
+        queryset: The queryset to explain
+        format: Optional backend-specific plan format (e.g. 'JSON')
+        analyze: Actually execute the query and report real timings
+
+    Returns:
+        str: The plan as reported by the database
+    """
+    options = {'analyze': True} if analyze else {}
+    return queryset.explain(format=format, **options)
+
+
+@contextmanager
+def wiki_jit(max_statement_seconds=5):
+    """
+    Scope a block of expression-heavy replica queries with per-vendor
+    execution tuning.
+
+    On PostgreSQL this enables JIT compilation inside a transaction
+    opened for the block — SET LOCAL is a no-op under autocommit, so the
+    block runs within atomic() to make the setting take effect and
+    guarantee it cannot leak past the block. On MariaDB it caps
+    statement runtime for the session so a mis-planned scan cannot pin
+    a replica connection indefinitely, restoring the default on exit;
+    stock MySQL has no max_statement_time, so only MariaDB gets it. On
+    other backends (SQLite locally) it is a no-op.
+
+    Example:
+        >>> with wiki_jit():
+        ...     stats = Page.objects.aggregate(total=Count('page_id'))
+    """
+    connection = connections['wiki_replica']
+    if connection.vendor == 'postgresql':
+        with transaction.atomic(using='wiki_replica'):
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL jit = on')
+                cursor.execute('SET LOCAL jit_above_cost = 100000')
+            yield
+    elif connection.vendor == 'mysql' and connection.mysql_is_mariadb:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SET SESSION max_statement_time = %s',
+                [max_statement_seconds],
+            )
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute('SET SESSION max_statement_time = DEFAULT')
+    else:
+        yield
+
+
 def get_page_statistics():
     """
     Get basic statistics about pages in the wiki.
 
+    Results are cached for PAGE_STATS_TTL seconds (override with the
+    WIKI_REPLICA_STATS_TTL setting), so dashboard refreshes and API
+    polls are served from the cache instead of re-scanning the page
+    table. Values are eventually consistent — the replica already lags
+    the live wiki.
+
     Returns:
         dict: Statistics including total pages, redirects, etc.
     """
-    total_pages = Page.objects.count()
-    redirects = Page.objects.filter(page_is_redirect=True).count()
-    new_pages = Page.objects.filter(page_is_new=True).count()
+    return cache.get_or_set(
+        PAGE_STATS_CACHE_KEY, _compute_page_statistics, PAGE_STATS_TTL
+    )
+
+
+def _compute_page_statistics():
+    """
+    Run the statistics aggregate against the replica.
+
+    All counts are computed in a single aggregate query with conditional
+    Count filters, so the database scans the page table once instead of
+    three times.
+    """
+    with wiki_jit():
+        stats = Page.objects.aggregate(
+            total=Count('page_id'),
+            redirects=Count('page_id', filter=Q(page_is_redirect=True)),
+            new_pages=Count('page_id', filter=Q(page_is_new=True)),
+        )
 
     return {
-        'total_pages': total_pages,
-        'redirects': redirects,
-        'new_pages': new_pages,
-        'content_pages': total_pages - redirects,
+        'total_pages': stats['total'],
+        'redirects': stats['redirects'],
+        'new_pages': stats['new_pages'],
+        'content_pages': stats['total'] - stats['redirects'],
     }